@@ -2,44 +2,142 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Any
+
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
-from .api import SolarmanApiClient
-from .const import CONF_APP_ID, CONF_APP_SECRET, CONF_DEVICE_SERIAL_NUMBER, LOGGER
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+
+from .api import AuthenticationError, SolarmanApiClient
+from .const import (
+    CONF_APP_ID,
+    CONF_APP_SECRET,
+    CONF_DEVICE_SERIAL_NUMBER,
+    CONF_RECORD,
+    CONF_REPLAY,
+    CONF_REPLAY_SPEED,
+    DATA_REPLAY,
+    DATA_TRANSPORT_FACTORY,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    LOGGER,
+)
 from .coordinator import SolarmanCoordinator, SolarmanData
+from .services import async_setup_services
+from .session import async_acquire_transport, async_release_session
+from .transport import (
+    AiohttpTransport,
+    RecordingTransport,
+    ReplayTransport,
+    TransportFactory,
+)
 
 _PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Exclusive(CONF_RECORD, "transport"): cv.string,
+                vol.Exclusive(CONF_REPLAY, "transport"): cv.string,
+                vol.Optional(CONF_REPLAY_SPEED, default=1.0): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, min_included=False)
+                ),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Solarman API transport and services."""
+    domain_config = config.get(DOMAIN, {})
+
+    if CONF_REPLAY in domain_config:
+        path = Path(hass.config.path(domain_config[CONF_REPLAY]))
+        LOGGER.warning("Replaying Solarman API responses from %s", path)
+        try:
+            hass.data[DATA_REPLAY] = await ReplayTransport.load(
+                path, domain_config[CONF_REPLAY_SPEED]
+            )
+        except (OSError, ValueError, KeyError) as error:
+            LOGGER.error("Could not load Solarman API recording: %s", error)
+            return False
+
+    hass.data[DATA_TRANSPORT_FACTORY] = _create_transport_factory(hass, domain_config)
+    async_setup_services(hass)
+    return True
+
+
+def _create_transport_factory(
+    hass: HomeAssistant, config: dict[str, Any]
+) -> TransportFactory:
+    """Create the transport factory for the record YAML config."""
+    if CONF_RECORD in config:
+        path = Path(hass.config.path(config[CONF_RECORD]))
+        LOGGER.warning("Recording Solarman API traffic to %s", path)
+        return lambda session: RecordingTransport(AiohttpTransport(session), path)
+    return AiohttpTransport
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Solarman API from a config entry."""
 
-    session = async_get_clientsession(hass)
-    client = SolarmanApiClient(
-        session,
-        entry.data[CONF_EMAIL],
-        entry.data[CONF_PASSWORD],
-        entry.data[CONF_APP_ID],
-        entry.data[CONF_APP_SECRET],
-    )
-    coordinator = SolarmanCoordinator(hass, entry, client)
+    update_interval = DEFAULT_SCAN_INTERVAL
+    if (replay := hass.data.get(DATA_REPLAY)) is not None:
+        # Replay recorded update cycles at the configured speed
+        update_interval /= replay.speed
+
+    transport = async_acquire_transport(hass, entry.entry_id)
+
+    try:
+        client = SolarmanApiClient(
+            transport,
+            entry.data[CONF_EMAIL],
+            entry.data[CONF_PASSWORD],
+            entry.data[CONF_APP_ID],
+            entry.data[CONF_APP_SECRET],
+        )
+        coordinator = SolarmanCoordinator(hass, entry, client, update_interval)
 
-    await coordinator.async_config_entry_first_refresh()
+        await coordinator.async_config_entry_first_refresh()
 
-    entry.runtime_data = SolarmanData(coordinator=coordinator)
+        entry.async_create_background_task(
+            hass, _async_renew_token(hass, entry, client), f"{DOMAIN} token renewal"
+        )
 
-    await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+        entry.runtime_data = SolarmanData(coordinator=coordinator)
+
+        await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+    except Exception:
+        await async_release_session(hass, entry.entry_id)
+        raise
 
     return True
 
 
+async def _async_renew_token(
+    hass: HomeAssistant, entry: ConfigEntry, client: SolarmanApiClient
+) -> None:
+    """Renew the token in the background until the credentials are rejected."""
+    try:
+        await client.renew_token_periodically()
+    except AuthenticationError:
+        entry.async_start_reauth(hass)
+
+
 # Update entry annotation
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
+    if unload_ok:
+        await async_release_session(hass, entry.entry_id)
+    return unload_ok
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
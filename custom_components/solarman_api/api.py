@@ -1,34 +1,54 @@
 """Solarman API."""
 
+import asyncio
 import hashlib
+import random
 import time
-from typing import Any, cast
+from datetime import date
+from typing import Any
 
 import aiohttp
 
+from .transport import Transport
+
+TOKEN_RENEWAL_MARGIN = 600
+TOKEN_RENEWAL_JITTER = 120
+TOKEN_RENEWAL_RETRY_MIN = 30
+TOKEN_RENEWAL_RETRY_MAX = 600
+TOKEN_RENEWAL_TIMEOUT = 30
+
 
 class SolarmanApiClient:
     """Solarman API client."""
 
     exiration_time: float
     access_token: str | None
+    token_fetched_at: float | None
+    renewal_count: int
+    renewal_failures: int
+    last_renewal_error: str | None
 
     def __init__(
         self,
-        session: aiohttp.ClientSession,
+        transport: Transport,
         email: str,
         password: str,
         application_id: str,
         application_secret: str,
     ) -> None:
         """Initialize."""
-        self.session = session
+        self.transport = transport
         self.email = email
         self.password = password
         self.application_id = application_id
         self.application_secret = application_secret
         self.exiration_time = 0
         self.access_token = None
+        self.token_fetched_at = None
+        self.renewal_count = 0
+        self.renewal_failures = 0
+        self.last_renewal_error = None
+        self._token_lock = asyncio.Lock()
 
     async def fetch_token(self) -> None:
         """Fetch new authorization token."""
@@ -39,52 +59,109 @@ class SolarmanApiClient:
             "email": self.email,
             "password": passhash,
         }
-        async with self.session.post(
+        json = await self.transport.post(
             f"https://globalapi.solarmanpv.com/account/v1.0/token?appId={self.application_id}",
-            json=data,
-        ) as response:
-            json = await response.json()
-            if not json["success"]:
-                if json["code"] == "2101021":
-                    raise InvalidApplicationIdError(json["msg"])
-                if json["code"] == "2101019":
-                    raise InvalidApplicationSecretError(json["msg"])
-                if json["code"] == "2101025":
-                    raise InvalidEmailOrPasswordSecretError
-                raise ApiError(json["msg"])
-
-            self.exiration_time = time.time() + float(json["expires_in"]) - 60
-            self.access_token = json["access_token"]
+            data,
+        )
+        if not json["success"]:
+            if json["code"] == "2101021":
+                raise InvalidApplicationIdError(json["msg"])
+            if json["code"] == "2101019":
+                raise InvalidApplicationSecretError(json["msg"])
+            if json["code"] == "2101025":
+                raise InvalidEmailOrPasswordSecretError
+            raise ApiError(json["msg"])
+
+        self.token_fetched_at = time.time()
+        self.exiration_time = self.token_fetched_at + float(json["expires_in"]) - 60
+        self.access_token = json["access_token"]
 
     async def get_token(self) -> str:
         """Get a valid authorization token."""
         if time.time() >= self.exiration_time:
-            await self.fetch_token()
+            async with self._token_lock:
+                if time.time() >= self.exiration_time:
+                    await self.fetch_token()
 
         if self.access_token is None:
             status = "could not get access token"
             raise AuthenticationError(status)
         return self.access_token
 
+    async def renew_token_periodically(self) -> None:
+        """Renew the authorization token ahead of its expiration, forever."""
+
+        while True:
+            jitter = random.uniform(0, TOKEN_RENEWAL_JITTER)  # noqa: S311
+            delay = self.exiration_time - TOKEN_RENEWAL_MARGIN - jitter - time.time()
+            await asyncio.sleep(max(delay, TOKEN_RENEWAL_RETRY_MIN))
+            await self._renew_token()
+
+    async def _renew_token(self) -> None:
+        """Renew the authorization token, retrying transient failures."""
+
+        retry_delay = TOKEN_RENEWAL_RETRY_MIN
+        while True:
+            try:
+                async with asyncio.timeout(TOKEN_RENEWAL_TIMEOUT), self._token_lock:
+                    await self.fetch_token()
+            except (
+                InvalidApplicationIdError,
+                InvalidApplicationSecretError,
+                InvalidEmailOrPasswordSecretError,
+            ) as error:
+                self.renewal_failures += 1
+                self.last_renewal_error = repr(error)
+                raise
+            except (SolarmanError, aiohttp.ClientError, TimeoutError) as error:
+                self.renewal_failures += 1
+                self.last_renewal_error = repr(error)
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, TOKEN_RENEWAL_RETRY_MAX)
+            else:
+                self.renewal_count += 1
+                self.last_renewal_error = None
+                return
+
     async def get_data(self, device_serial_number: str) -> dict[str, Any]:
         """Fetch data for device."""
 
+        return await self._device_request(
+            "currentData", {"deviceSn": device_serial_number}
+        )
+
+    async def get_historical_data(
+        self, device_serial_number: str, day: date
+    ) -> dict[str, Any]:
+        """Fetch historical data frames for device on a single day."""
+
+        return await self._device_request(
+            "historical",
+            {
+                "deviceSn": device_serial_number,
+                "startTime": day.isoformat(),
+                "endTime": day.isoformat(),
+                "timeType": 1,
+            },
+        )
+
+    async def _device_request(self, path: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Send an authorized request to a device endpoint."""
+
         token = await self.get_token()
-        data = {"deviceSn": device_serial_number}
         headers = {"Authorization": "Bearer " + token}
-        async with self.session.post(
-            "https://globalapi.solarmanpv.com/device/v1.0/currentData",
-            json=data,
-            headers=headers,
-        ) as response:
-            json = await response.json()
-            if not json["success"]:
-                if json["code"] == "2101008":
-                    raise InvalidDeviceSerialNumberError(json["msg"])
-                if json["code"] == "2101016":
-                    raise InvalidDeviceSerialNumberError(json["msg"])
-                raise ApiError(json["msg"])
-            return cast(dict[str, Any], json)
+        json = await self.transport.post(
+            f"https://globalapi.solarmanpv.com/device/v1.0/{path}",
+            data,
+            headers,
+        )
+        if not json["success"]:
+            if json["code"] == "2101008":
+                raise InvalidDeviceSerialNumberError(json["msg"])
+            if json["code"] == "2101016":
+                raise InvalidDeviceSerialNumberError(json["msg"])
+            raise ApiError(json["msg"])
+        return json
 
 
 class SolarmanError(Exception):
@@ -9,7 +9,7 @@ from typing import Any
 import voluptuous as vol
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_EMAIL, CONF_NAME, CONF_PASSWORD
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import callback
 
 from .api import (
     InvalidApplicationIdError,
@@ -19,6 +19,7 @@ from .api import (
     SolarmanError,
 )
 from .const import CONF_APP_ID, CONF_APP_SECRET, CONF_DEVICE_SERIAL_NUMBER, DOMAIN
+from .session import async_acquire_transport, async_release_session
 
 
 class SolarmanFlowHandler(ConfigFlow, domain=DOMAIN):
@@ -35,10 +36,10 @@ class SolarmanFlowHandler(ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
-            session = async_get_clientsession(self.hass)
+            transport = async_acquire_transport(self.hass, self.flow_id)
             async with timeout(10):
                 client = SolarmanApiClient(
-                    session,
+                    transport,
                     user_input[CONF_EMAIL],
                     user_input[CONF_PASSWORD],
                     user_input[CONF_APP_ID],
@@ -92,10 +93,10 @@ class SolarmanFlowHandler(ConfigFlow, domain=DOMAIN):
         """Confirm reauthentication dialog."""
         errors: dict[str, str] = {}
         if user_input:
-            session = async_get_clientsession(self.hass)
+            transport = async_acquire_transport(self.hass, self.flow_id)
             async with timeout(10):
                 client = SolarmanApiClient(
-                    session,
+                    transport,
                     user_input[CONF_EMAIL],
                     user_input[CONF_PASSWORD],
                     user_input[CONF_APP_ID],
@@ -131,3 +132,8 @@ class SolarmanFlowHandler(ConfigFlow, domain=DOMAIN):
             ),
             errors=errors,
         )
+
+    @callback
+    def async_remove(self) -> None:
+        """Release the shared session when the flow is removed."""
+        self.hass.async_create_task(async_release_session(self.hass, self.flow_id))
@@ -4,6 +4,10 @@ import logging
 from datetime import timedelta
 from typing import Final
 
+from homeassistant.util.hass_dict import HassKey
+
+from .transport import ReplayTransport, TransportFactory
+
 LOGGER = logging.getLogger(__package__)
 
 DOMAIN = "solarman_api"
@@ -11,8 +15,24 @@ DOMAIN = "solarman_api"
 CONF_APP_ID: Final = "app_id"
 CONF_APP_SECRET: Final = "app_secret"  # noqa: S105
 CONF_DEVICE_SERIAL_NUMBER: Final = "device_serial_number"
+CONF_RECORD: Final = "record"
+CONF_REPLAY: Final = "replay"
+CONF_REPLAY_SPEED: Final = "replay_speed"
 
 ATTRIBUTION = "Data provided by Solarman API"
 MANUFACTURER: Final = "Solarman"
 
 DEFAULT_SCAN_INTERVAL = timedelta(minutes=5)
+
+REFRESH_CONCURRENCY: Final = 4
+MAX_HISTORY_DAYS: Final = 31
+
+SESSION_MIN_CONNECTIONS: Final = 4
+SESSION_MAX_CONNECTIONS: Final = 16
+SESSION_KEEPALIVE_TIMEOUT: Final = 60
+SESSION_DNS_CACHE_TTL: Final = 300
+SESSION_CONNECT_TIMEOUT: Final = 5
+SESSION_READ_TIMEOUT: Final = 10
+
+DATA_TRANSPORT_FACTORY: HassKey[TransportFactory] = HassKey(f"{DOMAIN}_transport")
+DATA_REPLAY: HassKey[ReplayTransport] = HassKey(f"{DOMAIN}_replay")
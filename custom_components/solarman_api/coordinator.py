@@ -2,6 +2,7 @@
 
 from asyncio import timeout
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -42,6 +43,7 @@ class SolarmanCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         config_entry: ConfigEntry,
         client: SolarmanApiClient,
+        update_interval: timedelta = DEFAULT_SCAN_INTERVAL,
     ) -> None:
         """Initialize."""
 
@@ -55,7 +57,7 @@ class SolarmanCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             LOGGER,
             config_entry=config_entry,
             name=DOMAIN,
-            update_interval=DEFAULT_SCAN_INTERVAL,
+            update_interval=update_interval,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
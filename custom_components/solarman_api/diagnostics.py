@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -10,18 +11,34 @@ from homeassistant.core import HomeAssistant
 
 from .const import CONF_APP_SECRET
 from .coordinator import SolarmanConfigEntry, SolarmanData
+from .session import DATA_SESSION
 
 TO_REDACT = {CONF_EMAIL, CONF_PASSWORD, CONF_APP_SECRET}
 
 
 async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant,  # noqa: ARG001
+    hass: HomeAssistant,
     config_entry: SolarmanConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     solarman_data: SolarmanData = config_entry.runtime_data
+    client = solarman_data.coordinator.client
+    shared_session = hass.data.get(DATA_SESSION)
+    now = time.time()
 
     return {
         "entry_data": async_redact_data(dict(config_entry.data), TO_REDACT),
         "data": solarman_data.coordinator.data,
+        "token": {
+            "age": (
+                None
+                if client.token_fetched_at is None
+                else now - client.token_fetched_at
+            ),
+            "expires_in": client.exiration_time - now,
+            "renewal_count": client.renewal_count,
+            "renewal_failures": client.renewal_failures,
+            "last_renewal_error": client.last_renewal_error,
+        },
+        "session": None if shared_session is None else shared_session.as_dict(),
     }
@@ -0,0 +1,215 @@
+"""Services for the Solarman integration."""
+
+from __future__ import annotations
+
+import asyncio
+from asyncio import timeout
+from datetime import date, timedelta
+from typing import Any
+
+import aiohttp
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .api import ApiError
+from .const import DOMAIN, MAX_HISTORY_DAYS, REFRESH_CONCURRENCY
+from .coordinator import SolarmanConfigEntry, SolarmanCoordinator
+
+SERVICE_REFRESH = "refresh"
+SERVICE_GET_HISTORY = "get_history"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DEVICE_ID = "device_id"
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+
+REFRESH_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_CONFIG_ENTRY_ID, ATTR_DEVICE_ID),
+)
+
+GET_HISTORY_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+            vol.Optional(ATTR_DEVICE_ID): cv.string,
+            vol.Required(ATTR_START_DATE): cv.date,
+            vol.Required(ATTR_END_DATE): cv.date,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_CONFIG_ENTRY_ID, ATTR_DEVICE_ID),
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register services for the Solarman integration."""
+
+    async def async_refresh(call: ServiceCall) -> None:
+        """Refresh the selected devices in one batch."""
+        coordinators = _get_coordinators(hass, call)
+        semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
+
+        async def _refresh(coordinator: SolarmanCoordinator) -> None:
+            async with semaphore:
+                await coordinator.async_refresh()
+
+        await asyncio.gather(*(_refresh(c) for c in coordinators))
+
+        failed = [
+            c.config_entry.title for c in coordinators if not c.last_update_success
+        ]
+        if failed:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="refresh_failed",
+                translation_placeholders={"entries": ", ".join(failed)},
+            )
+
+    async def async_get_history(call: ServiceCall) -> ServiceResponse:
+        """Fetch historical data for a device as columnar arrays."""
+        coordinators = _get_coordinators(hass, call)
+        if len(coordinators) != 1:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="single_device_required",
+            )
+
+        start_date: date = call.data[ATTR_START_DATE]
+        end_date: date = call.data[ATTR_END_DATE]
+        if not 0 <= (end_date - start_date).days < MAX_HISTORY_DAYS:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="invalid_date_range",
+                translation_placeholders={"max_days": str(MAX_HISTORY_DAYS)},
+            )
+
+        return await _fetch_history(coordinators[0], start_date, end_date)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH, async_refresh, schema=REFRESH_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _get_coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[SolarmanCoordinator]:
+    """Resolve the config entries and devices of a service call to coordinators."""
+    entry_ids: list[str] = list(cv.ensure_list(call.data.get(ATTR_CONFIG_ENTRY_ID)))
+
+    device_registry = dr.async_get(hass)
+    for device_id in cv.ensure_list(call.data.get(ATTR_DEVICE_ID)):
+        device = device_registry.async_get(device_id)
+        if device is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="invalid_device",
+                translation_placeholders={"device_id": device_id},
+            )
+        entry_ids.extend(device.config_entries)
+
+    coordinators: dict[str, SolarmanCoordinator] = {}
+    for entry_id in entry_ids:
+        entry: SolarmanConfigEntry | None = hass.config_entries.async_get_entry(
+            entry_id
+        )
+        if entry is None or entry.domain != DOMAIN:
+            continue
+        if entry.state is not ConfigEntryState.LOADED:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entry_not_loaded",
+                translation_placeholders={"entry": entry.title},
+            )
+        coordinators[entry.entry_id] = entry.runtime_data.coordinator
+
+    if not coordinators:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="no_matching_entries",
+        )
+    return list(coordinators.values())
+
+
+async def _fetch_history(
+    coordinator: SolarmanCoordinator, start_date: date, end_date: date
+) -> dict[str, Any]:
+    """Fetch history one day at a time, appending frames to columns."""
+    times: list[int] = []
+    values: dict[str, list[Any]] = {}
+    units: dict[str, str | None] = {}
+
+    day = start_date
+    while day <= end_date:
+        try:
+            async with timeout(10):
+                page = await coordinator.client.get_historical_data(
+                    coordinator.device_serial_number, day
+                )
+        except ApiError as error:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="update_error",
+                translation_placeholders={"error": repr(error.status)},
+            ) from error
+        except aiohttp.ClientError as error:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="update_error",
+                translation_placeholders={"error": repr(str(error))},
+            ) from error
+        except TimeoutError as error:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="update_timeout",
+            ) from error
+
+        for frame in page.get("paramDataList") or []:
+            index = len(times)
+            times.append(int(frame["collectTime"]))
+            for item in frame["dataList"]:
+                column = values.get(item["key"])
+                if column is None:
+                    column = values[item["key"]] = [None] * index
+                    units[item["key"]] = item.get("unit")
+                column.append(_parse_value(item.get("value")))
+            for column in values.values():
+                if len(column) < len(times):
+                    column.append(None)
+
+        day += timedelta(days=1)
+
+    return {
+        "device_serial_number": coordinator.device_serial_number,
+        "time": times,
+        "units": units,
+        "values": values,
+    }
+
+
+def _parse_value(value: Any) -> Any:
+    """Return a numeric value as float, other values unchanged."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
@@ -0,0 +1,162 @@
+"""HTTP session shared by all Solarman API config entries."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ssl import client_context
+
+from .const import (
+    DATA_REPLAY,
+    DATA_TRANSPORT_FACTORY,
+    DOMAIN,
+    SESSION_CONNECT_TIMEOUT,
+    SESSION_DNS_CACHE_TTL,
+    SESSION_KEEPALIVE_TIMEOUT,
+    SESSION_MAX_CONNECTIONS,
+    SESSION_MIN_CONNECTIONS,
+    SESSION_READ_TIMEOUT,
+)
+from .transport import AiohttpTransport, Transport
+
+
+@dataclass
+class SessionStats:
+    """Connection pool usage of the shared session."""
+
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    connections_queued: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+
+@dataclass
+class SolarmanSession:
+    """Shared session and the config entries and flows using it."""
+
+    session: aiohttp.ClientSession
+    limit_per_host: int
+    stats: SessionStats
+    users: set[str] = field(default_factory=set)
+    remove_close_listener: CALLBACK_TYPE | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return pool settings and usage for diagnostics."""
+        return {
+            "limit_per_host": self.limit_per_host,
+            "users": len(self.users),
+            **asdict(self.stats),
+        }
+
+
+DATA_SESSION: HassKey[SolarmanSession] = HassKey(f"{DOMAIN}_session")
+
+
+@callback
+def async_acquire_session(hass: HomeAssistant, user: str) -> aiohttp.ClientSession:
+    """Return the shared session, creating it for the first user."""
+    shared = hass.data.get(DATA_SESSION)
+    if shared is None:
+        shared = _async_create_session(hass)
+        hass.data[DATA_SESSION] = shared
+
+        @callback
+        def _async_close(_event: Event) -> None:
+            shared.remove_close_listener = None
+            hass.async_create_task(shared.session.close(), eager_start=True)
+
+        shared.remove_close_listener = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close
+        )
+
+    shared.users.add(user)
+    return shared.session
+
+
+@callback
+def async_acquire_transport(hass: HomeAssistant, user: str) -> Transport:
+    """Return the transport for a user, acquiring the session unless replaying."""
+    if (replay := hass.data.get(DATA_REPLAY)) is not None:
+        return replay
+    factory = hass.data.get(DATA_TRANSPORT_FACTORY, AiohttpTransport)
+    return factory(async_acquire_session(hass, user))
+
+
+async def async_release_session(hass: HomeAssistant, user: str) -> None:
+    """Release the shared session, closing it after the last user."""
+    shared = hass.data.get(DATA_SESSION)
+    if shared is None:
+        return
+
+    shared.users.discard(user)
+    if shared.users:
+        return
+
+    del hass.data[DATA_SESSION]
+    if shared.remove_close_listener is not None:
+        shared.remove_close_listener()
+    await shared.session.close()
+
+
+def _async_create_session(hass: HomeAssistant) -> SolarmanSession:
+    """
+    Create a session tuned for frequent requests to the Solarman API host.
+
+    The per-host connection limit is sized from the number of config entries
+    when the session is created. Entries added later share that limit until
+    all users have released the session and it is created again.
+    """
+    entries = len(hass.config_entries.async_entries(DOMAIN))
+    limit_per_host = min(max(entries, SESSION_MIN_CONNECTIONS), SESSION_MAX_CONNECTIONS)
+    stats = SessionStats()
+
+    connector = aiohttp.TCPConnector(
+        limit_per_host=limit_per_host,
+        keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+        ssl=client_context(),
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=SESSION_CONNECT_TIMEOUT,
+            sock_read=SESSION_READ_TIMEOUT,
+        ),
+        headers={"User-Agent": SERVER_SOFTWARE},
+        trace_configs=[_create_trace_config(stats)],
+    )
+    return SolarmanSession(session, limit_per_host, stats)
+
+
+def _create_trace_config(stats: SessionStats) -> aiohttp.TraceConfig:
+    """Create a trace config counting connection pool usage."""
+    trace_config = aiohttp.TraceConfig()
+
+    def _count(name: str) -> Any:
+        async def _on_signal(
+            _session: aiohttp.ClientSession,
+            _context: SimpleNamespace,
+            _params: Any,
+        ) -> None:
+            setattr(stats, name, getattr(stats, name) + 1)
+
+        return _on_signal
+
+    trace_config.on_request_start.append(_count("requests"))
+    trace_config.on_connection_create_end.append(_count("connections_created"))
+    trace_config.on_connection_reuseconn.append(_count("connections_reused"))
+    trace_config.on_connection_queued_start.append(_count("connections_queued"))
+    trace_config.on_dns_cache_hit.append(_count("dns_cache_hits"))
+    trace_config.on_dns_cache_miss.append(_count("dns_cache_misses"))
+    return trace_config
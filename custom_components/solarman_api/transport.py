@@ -0,0 +1,149 @@
+"""Transports for Solarman API requests."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Protocol, cast
+from urllib.parse import urlsplit
+
+import aiohttp
+
+REDACTED = "**REDACTED**"
+REDACTED_KEYS = {"appSecret", "email", "password", "access_token", "refresh_token"}
+
+
+class Transport(Protocol):
+    """Send a request to the Solarman API and return the decoded response."""
+
+    async def post(
+        self,
+        url: str,
+        data: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Post JSON data and return the decoded JSON response."""
+
+
+type TransportFactory = Callable[[aiohttp.ClientSession], Transport]
+
+
+class AiohttpTransport:
+    """Transport sending requests with an aiohttp session."""
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        """Initialize."""
+        self.session = session
+
+    async def post(
+        self,
+        url: str,
+        data: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Post JSON data and return the decoded JSON response."""
+        async with self.session.post(url, json=data, headers=headers) as response:
+            return cast(dict[str, Any], await response.json())
+
+
+class RecordingTransport:
+    """
+    Transport appending redacted request/response pairs to a file.
+
+    Each line records the wall-clock request time "t", the response time "d"
+    in seconds, the URL without query string and the request and response.
+    """
+
+    def __init__(self, transport: Transport, path: Path) -> None:
+        """Initialize."""
+        self.transport = transport
+        self.path = path
+
+    async def post(
+        self,
+        url: str,
+        data: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Post JSON data through the wrapped transport and record the exchange."""
+        timestamp = time.time()
+        started = time.monotonic()
+        result = await self.transport.post(url, data, headers)
+        record = {
+            "t": round(timestamp, 3),
+            "d": round(time.monotonic() - started, 3),
+            "url": _strip_query(url),
+            "req": _redact(data),
+            "res": _redact(result),
+        }
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        await asyncio.to_thread(self._append, line)
+        return result
+
+    def _append(self, line: str) -> None:
+        """Append a line to the recording."""
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(line)
+
+
+class ReplayTransport:
+    """Transport serving responses from a recording, cycling when exhausted."""
+
+    def __init__(self, records: list[dict[str, Any]], speed: float = 1.0) -> None:
+        """Initialize."""
+        self.speed = speed
+        grouped: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for record in records:
+            key = _replay_key(record["url"], record["req"])
+            grouped.setdefault(key, []).append(record)
+        self._responses = {
+            key: itertools.cycle(value) for key, value in grouped.items()
+        }
+
+    @classmethod
+    async def load(cls, path: Path, speed: float = 1.0) -> ReplayTransport:
+        """Create a replay transport from a recording file."""
+        text = await asyncio.to_thread(path.read_text, encoding="utf-8")
+        return cls([json.loads(line) for line in text.splitlines() if line], speed)
+
+    async def post(
+        self,
+        url: str,
+        data: dict[str, Any],
+        headers: dict[str, str] | None = None,  # noqa: ARG002
+    ) -> dict[str, Any]:
+        """Return the next recorded response matching the request."""
+        responses = self._responses.get(_replay_key(_strip_query(url), data))
+        if responses is None:
+            msg = f"no recorded response for {_strip_query(url)}"
+            raise aiohttp.ClientConnectionError(msg)
+
+        record = next(responses)
+        await asyncio.sleep(record["d"] / self.speed)
+        return cast(dict[str, Any], record["res"])
+
+
+def _replay_key(url: str, data: dict[str, Any]) -> tuple[str, ...]:
+    """Return the key matching a request to its recorded responses."""
+    return (
+        url,
+        str(data.get("deviceSn", "")),
+        str(data.get("startTime", "")),
+        str(data.get("endTime", "")),
+    )
+
+
+def _strip_query(url: str) -> str:
+    """Remove the query string, which contains the application ID."""
+    return urlsplit(url)._replace(query="").geturl()
+
+
+def _redact(data: dict[str, Any]) -> dict[str, Any]:
+    """Redact credentials and tokens from a request or response."""
+    return {
+        key: REDACTED if key in REDACTED_KEYS else value for key, value in data.items()
+    }